@@ -25,6 +25,8 @@ class DisplayConfig:
     progress_color: int = 1984  # Green progress bar color (RGB565)
     brightness: int = 100  # Backlight brightness percentage (0-100)
     backlight_freq: int = 1000   # PWM frequency in Hz (Waveshare default)
+    playback_cpu: int = -1  # Pin the playback thread to this CPU core (-1 disables)
+    playback_rt_priority: int = 0  # SCHED_FIFO priority for the playback thread (0 disables, needs root)
 
 
 @dataclass
@@ -56,6 +58,7 @@ class MediaConfig:
     loop_count: int = 2  # Loop each media 2 times before advancing (was -1)
     static_image_duration_sec: int = 10  # How long to display static images
     auto_advance_enabled: bool = True  # Whether to auto-advance to next media in loop mode
+    frame_cache_mb: int = 64  # In-memory budget for decoded frame sequences (0 disables)
 
 
 @dataclass
@@ -1,13 +1,15 @@
 """Frame buffer utilities for LOOP display playback.
 
-Only `FrameSequence` is used at runtime; legacy FrameBuffer / FrameDecoder
-implementations and heavy image-processing helpers have been removed to
-trim bundle size and silence linters.
+Only `FrameSequence` (and the `FrameCache` it can fill) is used at runtime;
+legacy FrameBuffer / FrameDecoder implementations and heavy image-processing
+helpers have been removed to trim bundle size and silence linters.
 """
 
 # --- stdlib ---
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional
+from typing import Any, List, Optional, Tuple
+import os
 import queue
 import threading
 import time
@@ -16,16 +18,174 @@ import time
 from utils.logger import get_logger
 
 
+def _reset_thread_scheduling() -> None:
+    """Give the calling thread the main thread's CPU affinity and normal scheduling.
+    
+    Linux threads inherit affinity and policy from their creator, so producers started by
+    a pinned / SCHED_FIFO playback thread would otherwise share its core and priority.
+    """
+    try:
+        if hasattr(os, 'sched_setaffinity'):
+            # On Linux the process id names the main thread, which is never pinned
+            default_cpus = os.sched_getaffinity(os.getpid())
+            if os.sched_getaffinity(0) != default_cpus:
+                os.sched_setaffinity(0, default_cpus)
+        if hasattr(os, 'sched_setscheduler') and os.sched_getscheduler(0) != os.SCHED_OTHER:
+            os.sched_setscheduler(0, os.SCHED_OTHER, os.sched_param(0))
+    except OSError:
+        pass  # Keep the inherited settings rather than fail playback
+
+
+class FrameCache:
+    """Byte-budgeted LRU of fully loaded RGB565 frame sequences keyed by media slug.
+    
+    Each entry carries a version (the frames directory's mtime) so media re-processed
+    under the same slug is never served stale. Sequences still reading their first pass
+    reserve their expected size up front, and entries pinned by a playing sequence are
+    never evicted, so cached plus in-flight frames never exceed max_bytes.
+    """
+    
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Tuple[Any, List[bytes]]]" = OrderedDict()
+        self._sizes: dict = {}
+        self._pins: dict = {}
+        self._total_bytes = 0
+        self._reserved_bytes = 0
+        self._lock = threading.Lock()
+        self.logger = get_logger("framebuf")
+    
+    def get(self, key: str, version: Any = None, pin: bool = False) -> Optional[List[bytes]]:
+        """Return the cached frames for key, marking them most recently used.
+        
+        An entry cached under a different version is treated as a miss and dropped
+        unless a sequence still plays it. With pin, a hit stays resident until unpin(key).
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] != version:
+                if not self._pins.get(key):
+                    self._discard_locked(key)
+                return None
+            self._entries.move_to_end(key)
+            if pin:
+                self._pins[key] = self._pins.get(key, 0) + 1
+            return entry[1]
+    
+    def unpin(self, key: str) -> None:
+        """Let an entry pinned by get() or put() be evicted again."""
+        with self._lock:
+            count = self._pins.get(key, 0) - 1
+            if count > 0:
+                self._pins[key] = count
+            else:
+                self._pins.pop(key, None)
+    
+    def reserve(self, nbytes: int) -> bool:
+        """Reserve budget for a sequence that is still being read, evicting LRU entries."""
+        with self._lock:
+            if not self._evict_locked(nbytes):
+                return False
+            self._reserved_bytes += nbytes
+            return True
+    
+    def release(self, nbytes: int) -> None:
+        """Return a reservation that will not be turned into a cache entry."""
+        with self._lock:
+            self._reserved_bytes = max(0, self._reserved_bytes - nbytes)
+    
+    def put(self, key: str, frames: List[bytes], version: Any = None, reserved: int = 0,
+            pin: bool = False) -> bool:
+        """Cache a complete frame list, evicting least recently used entries to fit.
+        
+        reserved is the amount previously obtained from reserve() for these frames;
+        it is released whether or not the frames are cached. With pin, the new entry
+        stays resident until unpin(key).
+        """
+        size = sum(len(frame) for frame in frames)
+        
+        with self._lock:
+            self._reserved_bytes = max(0, self._reserved_bytes - reserved)
+            # A sequence still playing the previous entry keeps it; these frames stay uncached
+            if self._pins.get(key):
+                return False
+            self._discard_locked(key)
+            if not self._evict_locked(size):
+                return False
+            self._entries[key] = (version, frames)
+            self._sizes[key] = size
+            self._total_bytes += size
+            if pin:
+                self._pins[key] = 1
+        
+        self.logger.debug(f"Cached {len(frames)} frames for {key} ({size} bytes)")
+        return True
+    
+    def discard(self, key: str) -> None:
+        """Drop the cached frames for key, if any, even while pinned."""
+        with self._lock:
+            self._discard_locked(key)
+    
+    def _evict_locked(self, nbytes: int) -> bool:
+        """Evict unpinned LRU entries until nbytes fits; False (evicting nothing) if it cannot."""
+        pinned_bytes = sum(self._sizes[key] for key in self._entries if self._pins.get(key))
+        if pinned_bytes + self._reserved_bytes + nbytes > self.max_bytes:
+            return False
+        for key in list(self._entries):
+            if self._total_bytes + self._reserved_bytes + nbytes <= self.max_bytes:
+                break
+            if not self._pins.get(key):
+                self._discard_locked(key)
+        return True
+    
+    def _discard_locked(self, key: str) -> None:
+        if self._entries.pop(key, None) is not None:
+            self._total_bytes -= self._sizes.pop(key)
+    
+    def get_stats(self) -> dict:
+        """Get cache statistics."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "total_bytes": self._total_bytes,
+                "reserved_bytes": self._reserved_bytes,
+                "max_bytes": self.max_bytes
+            }
+
+
 class FrameSequence:
     """Manages a sequence of RGB565 frame files using a producer-consumer queue."""
     
-    def __init__(self, frames_dir: Path, frame_count: int, frame_duration: float = 0.04):
+    def __init__(self, frames_dir: Path, frame_count: int, frame_duration: float = 0.04,
+                 frame_cache: Optional[FrameCache] = None, cache_key: Optional[str] = None,
+                 cache_version: Any = None):
         self.frames_dir = frames_dir
         self.frame_count = frame_count
         self.frame_duration = frame_duration
         
         # Generate frame paths on-the-fly (no need to store massive arrays)
         self.logger = get_logger("framebuf")
+        
+        # Frames already in memory are served without touching the SD card; otherwise the
+        # first full pass from disk is collected and handed to the cache for later loops
+        self._frame_cache = frame_cache if cache_key else None
+        self._cache_key = cache_key
+        self._cache_version = cache_version
+        self._frames: Optional[List[bytes]] = None
+        self._frame_durations: Optional[List[float]] = None
+        # Frames served from the cache are pinned there until the producer exits
+        self._cache_pinned = False
+        if self._frame_cache:
+            cached = self._frame_cache.get(cache_key, cache_version, pin=True)
+            if cached is not None:
+                self._cache_pinned = True
+                if len(cached) == frame_count:
+                    self._frames = cached
+                else:
+                    self._frame_cache.unpin(cache_key)
+                    self._cache_pinned = False
 
         # Bounded queue to hold pre-loaded frames
         # Buffer ~1 second of frames @ 30fps, or 30 frames.
@@ -36,7 +196,7 @@ class FrameSequence:
         
         self.logger.info(
             f"Initialized sequence with {frame_count} frames "
-            "(producer-consumer buffer)"
+            f"({'memory cache' if self._frames is not None else 'producer-consumer buffer'})"
         )
 
     def _get_frame_path(self, frame_idx: int) -> Path:
@@ -45,28 +205,71 @@ class FrameSequence:
 
     def _produce_frames(self):
         """Producer thread: loads frames from disk and puts them in the queue."""
+        _reset_thread_scheduling()
         frame_idx = 0
-        while not self._stop_event.is_set():
-            if self.frame_count == 0:
-                time.sleep(0.1)
-                continue
+        # Frames of the first pass from disk, collected within a budget reserved in the cache
+        collecting = self._frame_cache is not None and self._frames is None
+        collected: Optional[List[bytes]] = None
+        collected_bytes = 0
+        reserved = 0
+        try:
+            while not self._stop_event.is_set():
+                if self.frame_count == 0:
+                    time.sleep(0.1)
+                    continue
 
-            frame_path = self._get_frame_path(frame_idx)
-            frame_data = self._load_frame(frame_path)
-            
-            # Use a timeout on put() to prevent deadlocking if the consumer stops reading.
-            try:
-                if frame_data:
-                    self.frame_queue.put(frame_data, timeout=1)
+                if self._frames is not None:
+                    frame_data = self._frames[frame_idx]
                 else:
-                    # If a frame fails to load, put a placeholder to not hang the consumer
-                    self.frame_queue.put(b'', timeout=1)
-            except queue.Full:
-                # This is okay. It means the consumer is paused or slow.
-                # Continue to the next loop iteration to check _stop_event.
-                continue
-
-            frame_idx = (frame_idx + 1) % self.frame_count
+                    frame_data = self._load_frame(self._get_frame_path(frame_idx))
+                    if collecting and collected is None and frame_idx == 0 and frame_data:
+                        # Frames share one size, so the first one tells us what to reserve
+                        reserved = len(frame_data) * self.frame_count
+                        if self._frame_cache.reserve(reserved):
+                            collected = []
+                        else:
+                            reserved = 0
+                            collecting = False
+                    if collected is not None and len(collected) == frame_idx:
+                        if frame_data and collected_bytes + len(frame_data) <= reserved:
+                            collected.append(frame_data)
+                            collected_bytes += len(frame_data)
+                        else:
+                            # Missing frame or over the reservation - keep streaming from disk
+                            self._frame_cache.release(reserved)
+                            reserved = 0
+                            collected = None
+                            collecting = False
+                
+                # Use a timeout on put() to prevent deadlocking if the consumer stops reading.
+                try:
+                    if frame_data:
+                        self.frame_queue.put(frame_data, timeout=1)
+                    else:
+                        # If a frame fails to load, put a placeholder to not hang the consumer
+                        self.frame_queue.put(b'', timeout=1)
+                except queue.Full:
+                    # This is okay. It means the consumer is paused or slow.
+                    # Continue to the next loop iteration to check _stop_event.
+                    continue
+
+                frame_idx = (frame_idx + 1) % self.frame_count
+                
+                # A complete first pass: publish it and serve later loops from memory
+                if collected is not None and frame_idx == 0 and len(collected) == self.frame_count:
+                    if self._frame_cache.put(self._cache_key, collected, self._cache_version,
+                                             reserved=reserved, pin=True):
+                        self._frames = collected
+                        self._cache_pinned = True
+                    reserved = 0
+                    collected = None
+                    collecting = False
+        finally:
+            if reserved:
+                self._frame_cache.release(reserved)
+            if self._cache_pinned:
+                self._frame_cache.unpin(self._cache_key)
+                self._cache_pinned = False
             
     def get_next_frame(self, timeout=1.0) -> Optional[bytes]:
         """Get the next frame from the queue."""
@@ -107,6 +310,12 @@ class FrameSequence:
         """Get duration for a specific frame."""
         return max(0.01, self.frame_duration)  # Minimum 10ms duration
     
+    def get_frame_durations(self) -> List[float]:
+        """Get the duration of every frame, computed once per sequence."""
+        if self._frame_durations is None:
+            self._frame_durations = [self.get_frame_duration(i) for i in range(self.frame_count)]
+        return self._frame_durations
+    
     def _load_frame(self, frame_path: Path) -> Optional[bytes]:
         """Load a frame from disk."""
         try:
@@ -1,5 +1,6 @@
 """Clean ILI9341 Display Driver - No Waveshare cruft needed."""
 
+import struct
 import time
 import spidev
 from gpiozero import DigitalOutputDevice, PWMOutputDevice
@@ -55,6 +56,11 @@ class ILI9341Display:
         self.digital_write(self.DC_PIN, True)
         self.spi_writebyte([val])
     
+    def data_bytes(self, values: bytes) -> None:
+        """Send several data bytes to display in a single SPI transfer."""
+        self.digital_write(self.DC_PIN, True)
+        self.spi_writebyte(values)
+    
     def digital_write(self, pin: DigitalOutputDevice, value: bool) -> None:
         """Write digital value to GPIO pin."""
         if value:
@@ -65,10 +71,10 @@ class ILI9341Display:
     def spi_writebyte(self, data) -> None:
         """Write data over SPI.
 
-        Accepts list[int], bytes, or bytearray. Uses writebytes2 when available for
+        Accepts list[int], bytes, bytearray or memoryview. Uses writebytes2 when available for
         raw bytes to avoid the heavy list[int] conversion that slows the Pi.
         """
-        if isinstance(data, (bytes, bytearray)):
+        if isinstance(data, (bytes, bytearray, memoryview)):
             # Prefer writebytes2 (spidev >= 3.5) which accepts a bytes-like object.
             writefast = getattr(self.SPI, "writebytes2", None)
             if writefast:
@@ -202,19 +208,13 @@ class ILI9341Display:
     
     def SetWindows(self, x_start: int, y_start: int, x_end: int, y_end: int) -> None:
         """Set the drawing window coordinates."""
-        # Set column address
+        # Set column address (start/end as big-endian 16-bit values in one transfer)
         self.command(0x2A)
-        self.data(x_start >> 8)
-        self.data(x_start & 0xFF)
-        self.data((x_end - 1) >> 8)
-        self.data((x_end - 1) & 0xFF)
+        self.data_bytes(struct.pack('>HH', x_start, x_end - 1))
         
         # Set row address
         self.command(0x2B)
-        self.data(y_start >> 8)
-        self.data(y_start & 0xFF)
-        self.data((y_end - 1) >> 8)
-        self.data((y_end - 1) & 0xFF)
+        self.data_bytes(struct.pack('>HH', y_start, y_end - 1))
         
         # Memory write command
         self.command(0x2C)
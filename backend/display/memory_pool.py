@@ -19,6 +19,8 @@ class FrameBufferPool:
         self._pool: deque = deque()
         self._in_use: set = set()
         self._lock = threading.Lock()
+        # Shared zero frame used to clear returned buffers without a per-return allocation
+        self._zero_frame = bytes(self.frame_size)
         
         # Pre-allocate frame buffers
         for _ in range(pool_size):
@@ -52,7 +54,10 @@ class FrameBufferPool:
                 self._in_use.remove(buffer_id)
                 if len(self._pool) < self.pool_size:
                     # Clear buffer contents for reuse
-                    buffer[:] = b'\x00' * len(buffer)
+                    if len(buffer) == self.frame_size:
+                        buffer[:] = self._zero_frame
+                    else:
+                        buffer[:] = bytes(len(buffer))
                     self._pool.append(buffer)
                 # If pool is full, let buffer be garbage collected
     
@@ -4,11 +4,12 @@ import io
 import time
 import threading
 import struct
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, Any, Deque, List
 from pathlib import Path
 from PIL import Image, ImageDraw, ImageFont
 from contextlib import contextmanager
-import queue
+from collections import OrderedDict, deque
+from functools import lru_cache
 
 from config.schema import DisplayConfig
 from display.memory_pool import get_frame_buffer_pool
@@ -20,9 +21,18 @@ def _rgb888_to_rgb565(r: int, g: int, b: int) -> int:
     return ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
 
 
+@lru_cache(maxsize=256)
+def _pack_be16(value: int) -> bytes:
+    """Pack an RGB565 value as big-endian bytes, reusing the bytes object per value."""
+    return struct.pack('>H', value)
+
+
 class MessageDisplay:
     """Handles all text messages and status displays for the screen."""
     
+    _PROGRESS_BAR_WIDTH = 180
+    _PROGRESS_BAR_HEIGHT = 20
+    
     def __init__(self, display_driver, display_config: DisplayConfig):
         """Initialize the message display system."""
         self.display_driver = display_driver
@@ -32,25 +42,61 @@ class MessageDisplay:
         # Cache for fonts to avoid reloading
         self._font_cache: Dict[Tuple[str, int], Any] = {}
         
-        # Thread-safe producer/consumer queue for display tasks
-        self._queue: "queue.Queue[Tuple[bytes, float]]" = queue.Queue(maxsize=32)
+        # Glyph bounding boxes keyed by (id(font), text); fonts live for the lifetime of _font_cache
+        self._bbox_cache: Dict[Tuple[int, str], Tuple[int, int, int, int]] = {}
+        self._bbox_cache_size = 256
+        
+        # Coverage -> RGB565 byte tables keyed by (text_color, bg_color)
+        self._text_lut_cache: Dict[Tuple[Tuple[int, int, int], Tuple[int, int, int]], Tuple[List[int], List[int]]] = {}
+        
+        # LRU cache of finished RGB565 frames so repeated status messages skip PIL entirely
+        self._frame_cache: "OrderedDict[Tuple, bytes]" = OrderedDict()
+        self._frame_cache_size = 32
+        self._frame_cache_lock = threading.Lock()
+        
+        # Pre-rendered progress frames (title, subtitle, empty bar) keyed by (title, subtitle, w, h)
+        self._progress_static_cache: Dict[Tuple[str, str, int, int], Tuple[bytes, int]] = {}
+        
+        # Last rendered progress update, used to drop redundant high-rate updates
+        self._last_progress_ts = 0.0
+        self._last_progress_key: Optional[Tuple[str, str, int]] = None
+        self._progress_min_interval = 0.033
+        
+        # Full solid-color RGB565 frames keyed by color
+        self._bg_cache: Dict[int, bytes] = {}
+        
+        # Pending frames for the worker. Timed frames are kept in order; a new persistent
+        # frame (duration 0) replaces any persistent frames the worker has not shown yet.
+        self._pending: Deque[Tuple[bytes, float]] = deque()
+        self._pending_cv = threading.Condition()
+        self._max_pending = 32
+        
+        # Persistent cached frame the worker last put on screen (None once anything else
+        # may have drawn over it), so repeating the same status message costs no SPI transfer
+        self._on_screen: Optional[bytes] = None
+        
+        # Guards _on_screen against invalidate_screen() from the playback thread; the
+        # counter lets the worker tell whether anything else drew while it was sending
+        self._screen_lock = threading.Lock()
+        self._external_draws = 0
+        
+        # Bumped after every frame the worker draws, so playback knows the screen changed
+        self._draw_generation = 0
         
-        # Lock to ensure only one thread talks to the display hardware at a time
-        self._display_lock = threading.Lock()
+        # Prime the queue with a blank frame so the worker has work the moment it starts;
+        # frames queued before it is scheduled simply wait in the deque, so nobody has to
+        # block on worker startup
+        self._pending.append((self._bg_template(0x0000), 0))
         
-        # Worker thread readiness event to prevent race conditions
-        self._worker_ready = threading.Event()
+        # Set on stop() so timed waits in the worker return immediately
+        self._shutdown_evt = threading.Event()
         
         # Worker thread that pulls from queue and handles timing
         self._worker_running = True
         self._worker_thread = threading.Thread(target=self._worker_loop, name="MessageDisplayWorker", daemon=True)
         self._worker_thread.start()
         
-        # Wait for worker thread to be ready (with timeout to prevent hanging)
-        if self._worker_ready.wait(timeout=2.0):
-            self.logger.info("Message display system initialized (async queue mode)")
-        else:
-            self.logger.warning("Message display worker thread did not signal ready within timeout")
+        self.logger.info("Message display system initialized (async queue mode)")
     
     @contextmanager
     def _get_frame_buffer(self):
@@ -108,66 +154,98 @@ class MessageDisplay:
         self._font_cache[cache_key] = font
         return font
     
+    def _cached_bbox(self, font: Any, text: str) -> Tuple[int, int, int, int]:
+        """Return font.getbbox(text), memoized for repeated status strings."""
+        key = (id(font), text)
+        bbox = self._bbox_cache.get(key)
+        if bbox is None:
+            if len(self._bbox_cache) >= self._bbox_cache_size:
+                self._bbox_cache.clear()
+            bbox = font.getbbox(text)
+            self._bbox_cache[key] = bbox
+        return bbox
+    
+    def _bg_template(self, rgb565: int) -> bytes:
+        """Get a full-screen RGB565 frame of a single color, cached per color."""
+        template = self._bg_cache.get(rgb565)
+        if template is None:
+            template = _pack_be16(rgb565) * (self.config.width * self.config.height)
+            self._bg_cache[rgb565] = template
+        return template
+    
     def _create_text_image_rgb565(self, title: str, subtitle: str = "", 
                                  bg_color: Tuple[int, int, int] = (0, 0, 0),
                                  text_color: Tuple[int, int, int] = (255, 255, 255),
                                  title_size: int = 24, subtitle_size: int = 16) -> Optional[bytes]:
-        """Create RGB565 buffer with text - using memory pool for efficiency."""
+        """Create RGB565 buffer with text, served from the frame cache when possible."""
+        cache_key = (title, subtitle, tuple(bg_color), tuple(text_color), title_size, subtitle_size,
+                     self.config.width, self.config.height)
+        
+        with self._frame_cache_lock:
+            frame_data = self._frame_cache.get(cache_key)
+            if frame_data is not None:
+                self._frame_cache.move_to_end(cache_key)
+                return frame_data
+        
+        frame_data = self._render_text_image_rgb565(title, subtitle, bg_color, text_color, title_size, subtitle_size)
+        if frame_data is None:
+            return None
+        
+        with self._frame_cache_lock:
+            self._frame_cache[cache_key] = frame_data
+            self._frame_cache.move_to_end(cache_key)
+            while len(self._frame_cache) > self._frame_cache_size:
+                self._frame_cache.popitem(last=False)
+        
+        return frame_data
+    
+    def _render_text_image_rgb565(self, title: str, subtitle: str,
+                                  bg_color: Tuple[int, int, int], text_color: Tuple[int, int, int],
+                                  title_size: int, subtitle_size: int) -> Optional[bytes]:
+        """Render RGB565 buffer with text - using memory pool for efficiency."""
         try:
-            width, height = self.config.width, self.config.height
+            width = self.config.width
             
             # Convert colors to RGB565 once
             bg_rgb565 = _rgb888_to_rgb565(*bg_color)
             
+            # Nothing to draw - a solid frame needs neither PIL nor a pooled buffer
+            if not title and not subtitle:
+                return self._bg_template(bg_rgb565)
+            
             # Use memory pool for frame buffer
             with self._get_frame_buffer() as frame_data:
                 if frame_data is None:
                     self.logger.error("Failed to get frame buffer from pool")
                     return None
                 
-                bg_bytes = struct.pack('>H', bg_rgb565)
+                # Fill with background color in a single slice assignment; FrameBufferPool
+                # zeroes buffers on return and allocates new ones zeroed, so black needs no fill
+                if bg_rgb565 != 0:
+                    frame_data[:] = self._bg_template(bg_rgb565)
+                
+                # Get fonts
+                title_font = self._get_font(title_size, bold=True)
+                subtitle_font = self._get_font(subtitle_size, bold=False)
+                
+                # Calculate text positioning
+                y_offset = 60  # Start 60px from top
                 
-                # Fill with background color
-                for i in range(0, len(frame_data), 2):
-                    frame_data[i:i+2] = bg_bytes
+                # Draw title (centered) - only the glyph region of the frame is touched
+                if title and title_font:
+                    bbox = self._cached_bbox(title_font, title)
+                    title_width = bbox[2] - bbox[0]
+                    title_height = bbox[3] - bbox[1]
+                    title_x = (width - title_width) // 2
+                    self._draw_text(frame_data, title, title_font, title_x, y_offset, text_color, bg_color)
+                    y_offset += title_height + 20
                 
-                # For complex text rendering, we still need PIL temporarily
-                # but we'll convert more efficiently
-                if title or subtitle:
-                    # Create PIL image for text rendering only
-                    pil_image = Image.new('RGB', (width, height), bg_color)
-                    draw = ImageDraw.Draw(pil_image)
-                    
-                    # Get fonts
-                    title_font = self._get_font(title_size, bold=True)
-                    subtitle_font = self._get_font(subtitle_size, bold=False)
-                    
-                    # Calculate text positioning
-                    y_offset = 60  # Start 60px from top
-                    
-                    # Draw title (centered)
-                    if title and title_font:
-                        bbox = draw.textbbox((0, 0), title, font=title_font)
-                        title_width = bbox[2] - bbox[0]
-                        title_height = bbox[3] - bbox[1]
-                        title_x = (width - title_width) // 2
-                        draw.text((title_x, y_offset), title, fill=text_color, font=title_font)
-                        y_offset += title_height + 20
-                    
-                    # Draw subtitle (centered)
-                    if subtitle and subtitle_font:
-                        bbox = draw.textbbox((0, 0), subtitle, font=subtitle_font)
-                        subtitle_width = bbox[2] - bbox[0]
-                        subtitle_x = (width - subtitle_width) // 2
-                        draw.text((subtitle_x, y_offset), subtitle, fill=text_color, font=subtitle_font)
-                    
-                    # Convert PIL to RGB565 efficiently - process row by row
-                    rgb_data = pil_image.tobytes()
-                    for i in range(0, len(rgb_data), 3):
-                        r, g, b = rgb_data[i], rgb_data[i+1], rgb_data[i+2]
-                        rgb565 = _rgb888_to_rgb565(r, g, b)
-                        pixel_offset = (i // 3) * 2
-                        frame_data[pixel_offset:pixel_offset+2] = struct.pack('>H', rgb565)
+                # Draw subtitle (centered)
+                if subtitle and subtitle_font:
+                    bbox = self._cached_bbox(subtitle_font, subtitle)
+                    subtitle_width = bbox[2] - bbox[0]
+                    subtitle_x = (width - subtitle_width) // 2
+                    self._draw_text(frame_data, subtitle, subtitle_font, subtitle_x, y_offset, text_color, bg_color)
                 
                 # Return a copy since frame_data will be returned to pool
                 return bytes(frame_data)
@@ -190,12 +268,8 @@ class MessageDisplay:
         try:
             frame_data = self._create_text_image(title, subtitle, bg_color, text_color)
             if frame_data is None:
-                # Fallback solid color frame
-                with self._get_frame_buffer() as fb:
-                    if fb is not None:
-                        solid_color = _rgb888_to_rgb565(*bg_color)
-                        fb[:] = struct.pack('>H', solid_color) * (len(fb) // 2)
-                        frame_data = bytes(fb)
+                # Fallback solid color frame - the cached background template is immutable
+                frame_data = self._bg_template(_rgb888_to_rgb565(*bg_color))
             self._enqueue_frame(frame_data, duration)
         except Exception as e:
             self.logger.error(f"Failed to show message '{title}': {e}")
@@ -267,165 +341,271 @@ class MessageDisplay:
     
     def show_progress_bar(self, title: str, subtitle: str, progress: float) -> None:
         """Display a progress bar with title and subtitle - using memory pool."""
+        # Skip updates that arrive faster than the display can use and would draw the same frame
+        now = time.monotonic()
+        progress_key = (title, subtitle, int(progress))
+        if progress_key == self._last_progress_key and now - self._last_progress_ts < self._progress_min_interval:
+            return
+        self._last_progress_ts = now
+        self._last_progress_key = progress_key
+        
         try:
-            width, height = self.config.width, self.config.height
+            width = self.config.width
             
-            # Use memory pool for frame buffer
-            with self._get_frame_buffer() as frame_data:
-                if frame_data is None:
-                    self.logger.error("Failed to get frame buffer from pool")
-                    return
-                
-                # Background color (black)
-                bg_rgb565 = _rgb888_to_rgb565(0, 0, 0)
-                bg_bytes = struct.pack('>H', bg_rgb565)
-                
-                # Fill with background
-                for i in range(0, len(frame_data), 2):
-                    frame_data[i:i+2] = bg_bytes
-                
-                # For text and progress bar, we'll still use PIL temporarily for complex rendering
-                # but convert more efficiently
-                pil_image = Image.new('RGB', (width, height), (0, 0, 0))
-                draw = ImageDraw.Draw(pil_image)
-                
-                # Get fonts
-                title_font = self._get_font(20, bold=True)
-                subtitle_font = self._get_font(14, bold=False)
-                
-                y_pos = 40
-                
-                # Draw title
-                if title and title_font:
-                    bbox = draw.textbbox((0, 0), title, font=title_font)
-                    title_width = bbox[2] - bbox[0]
-                    title_x = (width - title_width) // 2
-                    draw.text((title_x, y_pos), title, fill=(255, 255, 255), font=title_font)
-                    y_pos += 35
-                
-                # Draw subtitle  
-                if subtitle and subtitle_font:
-                    bbox = draw.textbbox((0, 0), subtitle, font=subtitle_font)
-                    subtitle_width = bbox[2] - bbox[0]
-                    subtitle_x = (width - subtitle_width) // 2
-                    draw.text((subtitle_x, y_pos), subtitle, fill=(200, 200, 200), font=subtitle_font)
-                    y_pos += 30
-                
-                # Draw progress bar
-                bar_width = 180
-                bar_height = 20
-                bar_x = (width - bar_width) // 2
-                bar_y = y_pos + 10
-                
-                # Progress bar background
-                draw.rectangle([bar_x, bar_y, bar_x + bar_width, bar_y + bar_height], 
-                             outline=(100, 100, 100), fill=(30, 30, 30))
-                
-                # Progress bar fill
-                fill_width = int((progress / 100.0) * bar_width)
+            # Static part of the frame (title, subtitle, empty bar) is rendered once per pair
+            base_frame, bar_y = self._get_progress_base(title, subtitle)
+            
+            # Frame buffer comes from the pool and is owned by the queue until displayed
+            frame_data = get_frame_buffer_pool().get_buffer()
+            if frame_data is None:
+                self.logger.error("Failed to get frame buffer from pool")
+                return
+            
+            try:
+                frame_data[:] = base_frame
+            
+                # Progress bar fill - only the fill rectangle is painted per tick
+                bar_x = (width - self._PROGRESS_BAR_WIDTH) // 2
+                fill_width = int((progress / 100.0) * self._PROGRESS_BAR_WIDTH)
                 if fill_width > 0:
                     # Use configured progress color or default blue
                     color = getattr(self.config, 'progress_color', 0x07FF)  # Default cyan
                     r = (color >> 11) << 3
                     g = ((color >> 5) & 0x3F) << 2  
                     b = (color & 0x1F) << 3
-                    draw.rectangle([bar_x, bar_y, bar_x + fill_width, bar_y + bar_height], 
-                                 fill=(r, g, b))
-                
-                # Progress percentage
+                    self._fill_rect(frame_data, bar_x, bar_y, bar_x + fill_width,
+                                    bar_y + self._PROGRESS_BAR_HEIGHT, _rgb888_to_rgb565(r, g, b))
+            
+                # Progress percentage - only the glyph region is redrawn
+                title_font = self._get_font(20, bold=True)
                 progress_text = f"{int(progress)}%"
                 if title_font:
-                    bbox = draw.textbbox((0, 0), progress_text, font=title_font)
+                    bbox = self._cached_bbox(title_font, progress_text)
                     progress_width = bbox[2] - bbox[0]
                     progress_x = (width - progress_width) // 2
-                    draw.text((progress_x, bar_y + 35), progress_text, fill=(255, 255, 255), font=title_font)
-                
-                # Convert PIL to RGB565 efficiently - direct pixel conversion
-                rgb_data = pil_image.tobytes()
-                for i in range(0, len(rgb_data), 3):
-                    r, g, b = rgb_data[i], rgb_data[i+1], rgb_data[i+2]
-                    rgb565 = _rgb888_to_rgb565(r, g, b)
-                    pixel_offset = (i // 3) * 2
-                    frame_data[pixel_offset:pixel_offset+2] = struct.pack('>H', rgb565)
-                
-                # Enqueue the frame (duration 0 = persistent until next update)
-                self._enqueue_frame(bytes(frame_data), 0)
+                    self._draw_text(frame_data, progress_text, title_font, progress_x, bar_y + 35,
+                                    (255, 255, 255), (0, 0, 0))
+            
+            except Exception:
+                get_frame_buffer_pool().return_buffer(frame_data)
+                raise
+            
+            # Hand the pooled buffer itself to the worker (duration 0 = persistent until
+            # next update); the worker returns it to the pool once it has been displayed
+            self._enqueue_frame(memoryview(frame_data).toreadonly(), 0)
             
         except Exception as e:
             self.logger.error(f"Failed to show progress bar: {e}")
     
+    def _get_progress_base(self, title: str, subtitle: str) -> Tuple[bytes, int]:
+        """Get the pre-rendered static progress frame and the bar's y position."""
+        width, height = self.config.width, self.config.height
+        cache_key = (title, subtitle, width, height)
+        
+        cached = self._progress_static_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        # Get fonts
+        title_font = self._get_font(20, bold=True)
+        subtitle_font = self._get_font(14, bold=False)
+        
+        base_frame = bytearray(self._bg_template(0x0000))
+        
+        y_pos = 40
+        
+        # Draw title
+        if title and title_font:
+            bbox = self._cached_bbox(title_font, title)
+            title_width = bbox[2] - bbox[0]
+            title_x = (width - title_width) // 2
+            self._draw_text(base_frame, title, title_font, title_x, y_pos, (255, 255, 255), (0, 0, 0))
+            y_pos += 35
+        
+        # Draw subtitle  
+        if subtitle and subtitle_font:
+            bbox = self._cached_bbox(subtitle_font, subtitle)
+            subtitle_width = bbox[2] - bbox[0]
+            subtitle_x = (width - subtitle_width) // 2
+            self._draw_text(base_frame, subtitle, subtitle_font, subtitle_x, y_pos, (200, 200, 200), (0, 0, 0))
+            y_pos += 30
+        
+        # Progress bar background - outline, then inner fill, painted straight into RGB565
+        bar_x = (width - self._PROGRESS_BAR_WIDTH) // 2
+        bar_y = y_pos + 10
+        bar_x1 = bar_x + self._PROGRESS_BAR_WIDTH
+        bar_y1 = bar_y + self._PROGRESS_BAR_HEIGHT
+        self._fill_rect(base_frame, bar_x, bar_y, bar_x1, bar_y1, _rgb888_to_rgb565(100, 100, 100))
+        self._fill_rect(base_frame, bar_x + 1, bar_y + 1, bar_x1 - 1, bar_y1 - 1, _rgb888_to_rgb565(30, 30, 30))
+        
+        # Subtitles change with every processing stage, so keep the cache small
+        if len(self._progress_static_cache) >= 16:
+            self._progress_static_cache.clear()
+        
+        cached = (bytes(base_frame), bar_y)
+        self._progress_static_cache[cache_key] = cached
+        return cached
+    
+    def _fill_rect(self, frame_data: bytearray, x0: int, y0: int, x1: int, y1: int, rgb565: int) -> None:
+        """Fill an inclusive rectangle of the RGB565 frame with one color, one slice per row."""
+        width = self.config.width
+        row = _pack_be16(rgb565) * (x1 - x0 + 1)
+        for y in range(y0, y1 + 1):
+            offset = (y * width + x0) * 2
+            frame_data[offset:offset + len(row)] = row
+    
+    def _text_luts(self, text_color: Tuple[int, int, int],
+                   bg_color: Tuple[int, int, int]) -> Tuple[List[int], List[int]]:
+        """Point tables mapping glyph coverage (0-255) straight to RGB565 high/low bytes."""
+        key = (text_color, bg_color)
+        luts = self._text_lut_cache.get(key)
+        if luts is None:
+            # Let Pillow blend every coverage level once so the tables match paste() exactly
+            ramp = Image.new('L', (256, 1))
+            ramp.putdata(range(256))
+            blended = Image.new('RGB', (256, 1), bg_color)
+            blended.paste(text_color, (0, 0, 256, 1), ramp)
+            rgb = blended.tobytes()
+            hi = [(rgb[i] & 0xF8) | (rgb[i + 1] >> 5) for i in range(0, 768, 3)]
+            lo = [((rgb[i + 1] & 0x1C) << 3) | (rgb[i + 2] >> 3) for i in range(0, 768, 3)]
+            luts = (hi, lo)
+            self._text_lut_cache[key] = luts
+        return luts
+    
+    def _draw_text(self, frame_data: bytearray, text: str, font: Any, x: int, y: int,
+                   text_color: Tuple[int, int, int], bg_color: Tuple[int, int, int]) -> None:
+        """Draw text into the RGB565 frame at (x, y), touching only the glyph bounding box."""
+        bbox = self._cached_bbox(font, text)
+        if bbox[2] <= bbox[0] or bbox[3] <= bbox[1]:
+            return
+        
+        # Rasterize glyphs into a small grayscale mask and map coverage directly to RGB565;
+        # the mask spans the full bbox, which can start left of or above the text origin
+        mask = Image.new('L', (bbox[2] - bbox[0], bbox[3] - bbox[1]), 0)
+        ImageDraw.Draw(mask).text((-bbox[0], -bbox[1]), text, fill=255, font=font)
+        clipped = self._clip_to_screen(mask, x + bbox[0], y + bbox[1])
+        if clipped is None:
+            return
+        mask, x, y = clipped
+        
+        hi_lut, lo_lut = self._text_luts(tuple(text_color), tuple(bg_color))
+        rgb565_data = Image.merge('LA', (mask.point(hi_lut), mask.point(lo_lut))).tobytes()
+        self._blit_rgb565(frame_data, rgb565_data, x, y, mask.size[0])
+    
+    def _clip_to_screen(self, image: Image.Image, x: int, y: int) -> Optional[Tuple[Image.Image, int, int]]:
+        """Crop an image placed at (x, y) to the visible area; None if nothing is visible."""
+        width, height = self.config.width, self.config.height
+        img_width, img_height = image.size
+        
+        left, top = max(0, -x), max(0, -y)
+        right, bottom = min(img_width, width - x), min(img_height, height - y)
+        if left >= right or top >= bottom:
+            return None
+        if (left, top, right, bottom) != (0, 0, img_width, img_height):
+            image = image.crop((left, top, right, bottom))
+        return image, x + left, y + top
+    
+    def _blit_rgb565(self, frame_data: bytearray, rgb565_data: bytes, x: int, y: int, img_width: int) -> None:
+        """Copy an on-screen block of RGB565 rows into the frame at (x, y)."""
+        width = self.config.width
+        row_bytes = img_width * 2
+        offset = (y * width + x) * 2
+        for start in range(0, len(rgb565_data), row_bytes):
+            frame_data[offset:offset + row_bytes] = rgb565_data[start:start + row_bytes]
+            offset += width * 2
+    
     def clear_screen(self, color: int = 0x0000) -> None:
         """Clear the screen with a solid color."""
-        with self._display_lock:
-            self.display_driver.fill_screen(color)
+        # Routed through the worker so it is the only thread touching the display hardware
+        self._enqueue_frame(self._bg_template(color), 0)
 
     # ------------------------------------------------------------
     # Background worker that consumes queued frames and shows them
     # ------------------------------------------------------------
     def _worker_loop(self):
         """Continuously consume the queue and display frames."""
-        # Signal that worker thread is ready to process messages
-        self._worker_ready.set()
-        
         # We purposefully keep this loop very simple and robust.
         while self._worker_running:
             try:
-                try:
-                    frame_data, duration = self._queue.get(timeout=0.1)
-                except queue.Empty:
-                    continue  # Timeout – allows checking _worker_running periodically
-                except (OSError, RuntimeError) as e:
-                    self.logger.warning(f"Queue error: {e}")
-                    continue
-                except Exception as e:
-                    self.logger.error(f"Unexpected queue error: {e}")
-                    continue
+                with self._pending_cv:
+                    while not self._pending and self._worker_running:
+                        self._pending_cv.wait()
+                    if not self._worker_running:
+                        break
+                    frame_data, duration = self._pending.popleft()
 
                 # Display the frame
                 if frame_data:
-                    with self._display_lock:
-                        try:
-                            self.display_driver.display_frame(frame_data)
-                            self.logger.debug(f"Successfully displayed frame ({len(frame_data)} bytes)")
-                        except (AttributeError, TypeError) as e:
-                            self.logger.error(f"Display driver method error: {e}")
-                        except (OSError, IOError, RuntimeError) as e:
-                            self.logger.error(f"Display hardware error: {e}")
-                        except Exception as e:
-                            self.logger.error(f"Unexpected display driver error: {e}")
+                    try:
+                        with self._screen_lock:
+                            self._on_screen = None
+                            draws_before = self._external_draws
+                        self.display_driver.display_frame(frame_data)
+                        self._draw_generation += 1
+                        if duration <= 0 and isinstance(frame_data, bytes):
+                            with self._screen_lock:
+                                # Only trust the frame if nothing else drew while it was sent
+                                if self._external_draws == draws_before:
+                                    self._on_screen = frame_data
+                        self.logger.debug(f"Successfully displayed frame ({len(frame_data)} bytes)")
+                    except (AttributeError, TypeError) as e:
+                        self.logger.error(f"Display driver method error: {e}")
+                    except (OSError, IOError, RuntimeError) as e:
+                        self.logger.error(f"Display hardware error: {e}")
+                    except Exception as e:
+                        self.logger.error(f"Unexpected display driver error: {e}")
+                    finally:
+                        self._release_frame(frame_data)
 
                 # Wait for duration (0 means persistent until next task)
                 if duration > 0:
-                    # Sleep in small increments so we can exit promptly on shutdown
-                    end_time = time.time() + duration
-                    while time.time() < end_time and self._worker_running:
-                        time.sleep(0.05)
+                    # Single timed wait that stop() can cut short
+                    self._shutdown_evt.wait(timeout=duration)
                 # If duration is 0, block until next item immediately – no extra sleep
 
             except Exception as e:
                 self.logger.error(f"Message worker loop error: {e}")
 
-    def _enqueue_frame(self, frame_data: Optional[bytes], duration: float):
-        """Put a frame onto the display queue, dropping on overflow to stay responsive."""
+    @property
+    def draw_generation(self) -> int:
+        """Count of frames the message worker has drawn; changes whenever it touches the screen."""
+        return self._draw_generation
+
+    def invalidate_screen(self) -> None:
+        """Note that something outside the message worker has drawn to the display."""
+        with self._screen_lock:
+            self._external_draws += 1
+            self._on_screen = None
+
+    @staticmethod
+    def _release_frame(frame_data: Any) -> None:
+        """Return a pooled frame buffer handed over as a memoryview; bytes frames are left alone."""
+        if isinstance(frame_data, memoryview):
+            get_frame_buffer_pool().return_buffer(frame_data.obj)
+            frame_data.release()
+
+    def _enqueue_frame(self, frame_data: Optional[Any], duration: float):
+        """Hand a frame to the display worker, coalescing bursts of persistent frames."""
         if frame_data is None:
             return
 
-        # Wait for worker thread to be ready before enqueuing important messages
-        if not self._worker_ready.is_set():
-            self.logger.debug("Waiting for worker thread to be ready...")
-            self._worker_ready.wait(timeout=1.0)
-
-        try:
-            # Longer timeout for important messages like boot message  
-            timeout = 1.0 if duration > 0 else 0.5  # Boot messages have duration, use longer timeout
-            self._queue.put((frame_data, duration), timeout=timeout)
-        except queue.Full:
-            # Queue full – drop the message, but log once
-            self.logger.warning("Message queue full – dropping frame")
-        except (OSError, RuntimeError) as e:
-            self.logger.warning(f"Queue put error: {e}")
-        except Exception as e:
-            self.logger.error(f"Unexpected queue put error: {e}")
+        with self._pending_cv:
+            if duration <= 0:
+                # Latest persistent frame wins - drop persistent frames not yet displayed
+                while self._pending and self._pending[-1][1] <= 0:
+                    self._release_frame(self._pending.pop()[0])
+                # Identical persistent frame already showing and nothing queued ahead of it
+                if not self._pending:
+                    with self._screen_lock:
+                        if frame_data is self._on_screen:
+                            return
+            elif len(self._pending) >= self._max_pending:
+                # Backlog of timed messages – drop the message to stay responsive
+                self.logger.warning("Message queue full – dropping frame")
+                self._release_frame(frame_data)
+                return
+            self._pending.append((frame_data, duration))
+            self._pending_cv.notify()
 
     # ------------------------------------------------------------
     # Public shutdown helper
@@ -433,18 +613,16 @@ class MessageDisplay:
     def stop(self):
         """Stop the background worker thread gracefully."""
         self._worker_running = False
-        # Unblock queue get() quickly
-        try:
-            self._queue.put_nowait((None, 0))
-        except queue.Full:
-            # Queue is full, but that's ok for shutdown
-            pass
-        except (OSError, RuntimeError) as e:
-            self.logger.debug(f"Error unblocking queue during shutdown: {e}")
-        except Exception as e:
-            self.logger.warning(f"Unexpected error unblocking queue during shutdown: {e}")
+        self._shutdown_evt.set()
+        # Wake the worker if it is waiting for frames
+        with self._pending_cv:
+            self._pending_cv.notify_all()
         if self._worker_thread:
             self._worker_thread.join(timeout=2)
+        # Hand back any pooled buffers still waiting in the queue
+        with self._pending_cv:
+            while self._pending:
+                self._release_frame(self._pending.popleft()[0])
 
 
 # Global message display instance (set by player when initialized)
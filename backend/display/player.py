@@ -1,6 +1,7 @@
 # backend/display/player.py
 
 import json
+import os
 import threading
 import time
 import asyncio
@@ -12,7 +13,7 @@ from dataclasses import dataclass, field
 from enum import Enum
 
 from config.schema import DisplayConfig, MediaConfig
-from display.framebuf import FrameSequence
+from display.framebuf import FrameCache, FrameSequence
 from display.spiout import ILI9341Driver
 from display.messages import MessageDisplay, set_message_display
 from utils.logger import get_logger
@@ -337,9 +338,18 @@ class DisplayPlayer:
         self.media_dir = Path("media/processed")
         self.current_sequence: Optional[FrameSequence] = None
         
+        # Next media's sequence, started near the end of the current pass so its first
+        # frames are already buffered when playback advances: (slug, sequence)
+        self._prefetched: Optional[Tuple[str, FrameSequence]] = None
+        self._prefetch_lock = threading.Lock()
+        self._prefetch_frames = 8  # Start prefetching this many frames before the end
+        
+        # Frames of recently played media kept in memory so loops skip the SD card
+        cache_mb = getattr(media_config, 'frame_cache_mb', 64)
+        self.frame_cache: Optional[FrameCache] = FrameCache(cache_mb * 1024 * 1024) if cache_mb > 0 else None
+        
         # Playback control
         self.running = False
-        self.paused = False
         self.frame_rate = display_config.framerate
         self.loop_count = media_config.loop_count
         self.loop_mode = "all"  # "all" or "one"
@@ -353,10 +363,25 @@ class DisplayPlayer:
         self.progress_thread: Optional[threading.Thread] = None
         self.progress_stop_event = threading.Event()
         
-        # Event-based pause handling
+        # Event-based pause handling (set = playing, clear = paused)
         self.pause_event = threading.Event()
         self.pause_event.set()
         
+        # Set on stop() so idle waits in the playback loop return immediately
+        self._stop_event = threading.Event()
+        
+        # Set when the media list changes so the idle "no media" wait wakes up at once
+        self._media_changed = threading.Event()
+        
+        # Debounced media list refresh so a burst of loop edits restarts playback once
+        self._refresh_timer: Optional[threading.Timer] = None
+        self._refresh_lock = threading.Lock()
+        self._refresh_delay = 0.5  # seconds
+        # Refresh requests made so far, and how many had been made when the current
+        # sequence was loaded - a sequence loaded after the latest request is already fresh
+        self._refresh_requests = 0
+        self._sequence_refresh = -1
+        
         # Threading
         self.playback_thread: Optional[threading.Thread] = None
         self.lock = threading.Lock()
@@ -381,6 +406,11 @@ class DisplayPlayer:
             self.logger.debug(f"Display hardware not available: {e}")
             return False
     
+    @property
+    def paused(self) -> bool:
+        """Whether playback is paused - derived from pause_event, the single source of truth."""
+        return not self.pause_event.is_set()
+    
     def _wait_interruptible(self, duration: float) -> bool:
         """Wait for duration but return immediately if interrupted or paused."""
         if duration <= 0:
@@ -405,7 +435,7 @@ class DisplayPlayer:
             remaining = duration - (time.time() - start_time)
             sleep_time = min(remaining, 0.1)
             if sleep_time > 0:
-                time.sleep(sleep_time)
+                self._stop_event.wait(sleep_time)
         
         return True  # Completed normally
     
@@ -421,11 +451,8 @@ class DisplayPlayer:
         if not active_slug:
             return 0
         
-        loop_slugs = media_index.list_loop()
-        try:
-            return loop_slugs.index(active_slug)
-        except ValueError:
-            return 0
+        position = media_index.loop_position(active_slug)
+        return position if position is not None else 0
     
     def load_current_sequence(self) -> bool:
         """Load the current media sequence."""
@@ -434,19 +461,20 @@ class DisplayPlayer:
             self.current_sequence.stop()
             self.current_sequence = None
 
-        loop_media = self.get_current_loop_media()
+        # Resolve only the active item - no need to materialize the whole loop per switch
+        loop_slugs = media_index.list_loop()
         current_index = self.get_current_media_index()
         
-        if not loop_media or current_index >= len(loop_media):
+        if not loop_slugs or current_index >= len(loop_slugs):
             self.logger.warning("No media available to load")
             return False
         
-        media_info = loop_media[current_index]
-        media_slug = media_info.get('slug')
+        media_slug = loop_slugs[current_index]
+        media_info = media_index.get_media(media_slug)
         
-        if not media_slug:
-            self.logger.error("Media has no slug")
-            return False
+        if media_info is None:
+            # Loop entry without metadata - fall back to the wraparound search
+            return self._find_and_load_next_valid_media()
         
         frames_dir = self.media_dir / media_slug / "frames"
         
@@ -462,13 +490,8 @@ class DisplayPlayer:
             return self._find_and_load_next_valid_media()
         
         try:
-            # Get frame info from media metadata
-            frame_count = media_info.get('frame_count', 0)
-            fps = media_info.get('fps', 25)  # Default 25fps
-            frame_duration = 1.0 / fps
-            
             # Create frame sequence
-            self.current_sequence = FrameSequence(frames_dir, frame_count, frame_duration)
+            self.current_sequence = self._create_sequence(media_info, frames_dir)
             
             if self.current_sequence.get_frame_count() == 0:
                 self.logger.error(f"No frames found in {frames_dir}")
@@ -485,89 +508,141 @@ class DisplayPlayer:
             self.logger.error(f"Failed to load sequence: {e}")
             return False
     
+    def _create_sequence(self, media_info: Dict, frames_dir: Path) -> FrameSequence:
+        """Create the frame sequence for a media item, backed by the in-memory frame cache."""
+        # Reuse the prefetched sequence when playback advanced to the media we guessed
+        prefetched = self._take_prefetched(media_info.get('slug'))
+        if prefetched:
+            return prefetched
+        
+        # Get frame info from media metadata
+        frame_count = media_info.get('frame_count', 0)
+        fps = media_info.get('fps', 25)  # Default 25fps
+        frame_duration = 1.0 / fps
+        
+        # Re-processing a slug recreates its frames directory, which changes its mtime
+        cache_key = media_info.get('slug')
+        try:
+            cache_version = frames_dir.stat().st_mtime_ns
+        except OSError:
+            cache_key, cache_version = None, None  # Unversioned frames are never cached
+        
+        return FrameSequence(frames_dir, frame_count, frame_duration,
+                             frame_cache=self.frame_cache, cache_key=cache_key,
+                             cache_version=cache_version)
+    
+    def _take_prefetched(self, slug: Optional[str]) -> Optional[FrameSequence]:
+        """Claim the prefetched sequence if it is for slug; any other prefetch is stopped."""
+        with self._prefetch_lock:
+            prefetched, self._prefetched = self._prefetched, None
+        if not prefetched:
+            return None
+        if slug and prefetched[0] == slug:
+            return prefetched[1]
+        prefetched[1].stop()
+        return None
+    
+    def _prefetch_next_sequence(self) -> None:
+        """Start loading the media that follows the active one in the loop."""
+        if self._stop_event.is_set():
+            return  # Shutting down - nothing would ever stop the producer
+        
+        next_slug = media_index.get_loop_neighbor(1)
+        if next_slug is None:
+            return
+        
+        with self._prefetch_lock:
+            if self._prefetched and self._prefetched[0] == next_slug:
+                return
+        
+        media_info = media_index.get_media(next_slug)
+        frames_dir = self.media_dir / next_slug / "frames"
+        if not media_info or not frames_dir.exists():
+            return
+        
+        self._take_prefetched(None)  # Drop a stale prefetch
+        try:
+            sequence = self._create_sequence(media_info, frames_dir)
+        except Exception as e:
+            self.logger.debug(f"Prefetch of {next_slug} failed: {e}")
+            return
+        with self._prefetch_lock:
+            self._prefetched = (next_slug, sequence)
+        self.logger.debug(f"Prefetching next media: {next_slug}")
+    
+    def _should_advance(self, loops_completed: int, loop_length: int) -> bool:
+        """Whether playback moves on to the next media after loops_completed passes."""
+        if self.loop_mode == "one" or loop_length <= 1:
+            return False
+        if not self.media_config.auto_advance_enabled:
+            return False
+        # Infinite loops (loop_count <= 0) play once then move to next
+        return self.loop_count <= 0 or loops_completed >= self.loop_count
+    
     def next_media(self) -> None:
         """Switch to next media."""
         with self.lock:
-            # Stop the producer thread of the current sequence
-            if self.current_sequence:
-                self.current_sequence.stop()
-                self.current_sequence = None
+            # Detach the current sequence; its producer thread is stopped outside the lock
+            sequence, self.current_sequence = self.current_sequence, None
 
-            loop_slugs = media_index.list_loop()
-            
-            if len(loop_slugs) <= 1:
-                return
-            
-            current_slug = media_index.get_active()
-            try:
-                current_index = loop_slugs.index(current_slug) if current_slug else 0
-            except ValueError:
-                current_index = 0
-            
-            # Move to next item in loop
-            next_index = (current_index + 1) % len(loop_slugs)
-            next_slug = loop_slugs[next_index]
-            
-            # Set as active - sequence will be loaded in main loop
-            media_index.set_active(next_slug)
-            media_dict = media_index.get_media_dict()
-            media_name = media_dict.get(next_slug, {}).get('original_filename', 'Unknown')
-            self.logger.info(f"Switched to next media: {media_name}")
+            # Move to next item in loop (None when there is nothing to switch to)
+            next_slug = media_index.get_loop_neighbor(1)
+        
+        if sequence:
+            sequence.stop()
+        if next_slug is None:
+            return
+        
+        # Set as active outside the player lock - the index write must not stall playback
+        media_index.set_active(next_slug)
+        media_name = (media_index.get_media(next_slug) or {}).get('original_filename', 'Unknown')
+        self.logger.info(f"Switched to next media: {media_name}")
     
     def previous_media(self) -> None:
         """Switch to previous media."""
         with self.lock:
-            # Stop the producer thread of the current sequence
-            if self.current_sequence:
-                self.current_sequence.stop()
-                self.current_sequence = None
+            # Detach the current sequence; its producer thread is stopped outside the lock
+            sequence, self.current_sequence = self.current_sequence, None
 
-            loop_slugs = media_index.list_loop()
-            
-            if len(loop_slugs) <= 1:
-                return
-            
-            current_slug = media_index.get_active()
-            try:
-                current_index = loop_slugs.index(current_slug) if current_slug else 0
-            except ValueError:
-                current_index = 0
-            
-            # Move to previous item in loop
-            prev_index = (current_index - 1) % len(loop_slugs)
-            prev_slug = loop_slugs[prev_index]
-            
-            # Set as active - sequence will be loaded in main loop
-            media_index.set_active(prev_slug)
-            media_dict = media_index.get_media_dict()
-            media_name = media_dict.get(prev_slug, {}).get('original_filename', 'Unknown')
-            self.logger.info(f"Switched to previous media: {media_name}")
+            # Move to previous item in loop (None when there is nothing to switch to)
+            prev_slug = media_index.get_loop_neighbor(-1)
+        
+        if sequence:
+            sequence.stop()
+        if prev_slug is None:
+            return
+        
+        # Set as active outside the player lock - the index write must not stall playback
+        media_index.set_active(prev_slug)
+        media_name = (media_index.get_media(prev_slug) or {}).get('original_filename', 'Unknown')
+        self.logger.info(f"Switched to previous media: {media_name}")
     
     def set_active_media(self, slug: str) -> bool:
         """Set the active media to the specified slug."""
+        # Check if slug exists in media
+        media_info = media_index.get_media(slug)
+        if media_info is None:
+            self.logger.warning(f"Media with slug '{slug}' not found")
+            return False
+        
         with self.lock:
-            # Stop the producer thread of the current sequence
-            if self.current_sequence:
-                self.current_sequence.stop()
-
-            # Check if slug exists in media
-            media_dict = media_index.get_media_dict()
-            if slug not in media_dict:
-                self.logger.warning(f"Media with slug '{slug}' not found")
-                return False
-            
-            # Set as active and clear current sequence to trigger reload
-            media_index.set_active(slug)
-            self.current_sequence = None  # Force reload on next cycle
-            media_name = media_dict.get(slug, {}).get('original_filename', 'Unknown')
-            self.logger.info(f"Set active media: {media_name}")
-            return True
+            # Clear current sequence to trigger reload on next cycle
+            sequence, self.current_sequence = self.current_sequence, None
+        
+        # Stop the old producer thread outside the lock - joining it can take a while
+        if sequence:
+            sequence.stop()
+        
+        # Set as active outside the player lock - the index write must not stall playback
+        media_index.set_active(slug)
+        media_name = media_info.get('original_filename', 'Unknown')
+        self.logger.info(f"Set active media: {media_name}")
+        return True
     
     def toggle_pause(self) -> None:
         """Toggle playback pause state."""
         with self.lock:
-            self.paused = not self.paused
-            if self.paused:
+            if self.pause_event.is_set():
                 self.pause_event.clear()  # Block playback
             else:
                 self.pause_event.set()    # Resume playback
@@ -575,7 +650,7 @@ class DisplayPlayer:
     
     def is_paused(self) -> bool:
         """Check if playback is paused."""
-        return self.paused
+        return not self.pause_event.is_set()
     
     def toggle_loop_mode(self) -> str:
         """Toggle between 'all' and 'one' loop modes."""
@@ -790,36 +865,60 @@ class DisplayPlayer:
         
         self.message_display.show_no_media_message(web_url, hotspot_info)
     
+    def _apply_thread_scheduling(self) -> None:
+        """Pin the calling (playback) thread to a core and/or give it real-time priority."""
+        cpu = getattr(self.display_config, 'playback_cpu', -1)
+        if cpu >= 0 and hasattr(os, 'sched_setaffinity'):
+            try:
+                os.sched_setaffinity(0, {cpu})
+                self.logger.info(f"Playback thread pinned to CPU {cpu}")
+            except (OSError, ValueError) as e:
+                self.logger.warning(f"Could not pin playback thread to CPU {cpu}: {e}")
+        
+        priority = getattr(self.display_config, 'playback_rt_priority', 0)
+        if priority > 0 and hasattr(os, 'sched_setscheduler'):
+            try:
+                os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+                self.logger.info(f"Playback thread running SCHED_FIFO at priority {priority}")
+            except (OSError, ValueError) as e:
+                self.logger.warning(f"Could not raise playback thread priority: {e}")
+    
     def run(self) -> None:
         """Main playback loop."""
         self.logger.info("Starting playback loop")
+        self._apply_thread_scheduling()
         
         while self.running:
             try:
                 # Don't interfere with upload progress display
                 if self.showing_progress:
-                    time.sleep(0.5)
+                    self._stop_event.wait(0.5)
                     continue
                 
                 # Get current loop state
-                loop_slugs = media_index.list_loop()
+                loop_length = media_index.loop_length()
                 
                 # Check if we have media to play
-                if not loop_slugs:
+                if not loop_length:
                     self.show_no_media_message()
-                    time.sleep(1)
+                    # Wake immediately on a media change (or stop); the timeout only keeps the
+                    # network info on the message fresh and catches index writes made elsewhere
+                    self._media_changed.wait(1)
+                    self._media_changed.clear()
                     continue
                 
                 # Load current sequence if needed
                 if not self.current_sequence:
+                    refresh_seen = self._refresh_requests
                     if not self.load_current_sequence():
                         # Failed to load, try next media or wait
-                        if len(loop_slugs) > 1:
+                        if loop_length > 1:
                             self.next_media()
-                            time.sleep(2)
+                            self._stop_event.wait(2)
                         else:
-                            time.sleep(5)  # Wait longer for single media to reduce spam
+                            self._stop_event.wait(5)  # Wait longer for single media to reduce spam
                         continue
+                    self._sequence_refresh = refresh_seen
                     # Reset loop counter when loading new media
                     self.current_media_loops = 0
                 
@@ -838,9 +937,12 @@ class DisplayPlayer:
                         self.logger.info(f"📸 Displaying static image ({len(frame_data)} bytes) for {self.static_image_display_time}s")
                         if self.display_available:
                             self.display_driver.display_frame(frame_data)
+                            self.message_display.invalidate_screen()
                         else:
                             # Demo mode - simulate display with longer delay
                             self.logger.debug("🔄 Demo mode: simulating static image display")
+                        if self._should_advance(self.current_media_loops + 1, loop_length):
+                            self._prefetch_next_sequence()
                         self._wait_interruptible(self.static_image_display_time)
                     else:
                         self.logger.warning("❌ Failed to get frame data for static image")
@@ -848,33 +950,69 @@ class DisplayPlayer:
                     # Play animated sequence
                     sequence_completed = True
                     
+                    # Effective per-frame durations resolved once per pass, not per frame
+                    default_frame_time = 1.0 / self.frame_rate
+                    frame_times = [d if d > 0 else default_frame_time for d in sequence.get_frame_durations()]
+                    
+                    # Start buffering the next media shortly before a pass that ends in an advance
+                    prefetch_at = -1
+                    if self._should_advance(self.current_media_loops + 1, loop_length):
+                        prefetch_at = max(0, frame_count - self._prefetch_frames)
+                    
+                    # Bind per-frame lookups to locals once per pass
+                    get_next_frame = sequence.get_next_frame
+                    display_frame = self.display_driver.display_frame
+                    invalidate_screen = self.message_display.invalidate_screen
+                    pause_event = self.pause_event
+                    monotonic = time.monotonic
+                    sleep = time.sleep
+                    
+                    # Last frame sent this pass; identical consecutive frames skip the SPI transfer
+                    # unless the message worker has drawn over it since
+                    message_display = self.message_display
+                    last_frame = None
+                    message_draws = message_display.draw_generation
+                    
+                    # Absolute frame deadline on the monotonic clock so timing error doesn't accumulate
+                    deadline = monotonic()
+                    
                     for frame_idx in range(frame_count):
                         if not self.running or self.showing_progress:
                             sequence_completed = False
                             break
                         
-                        # Handle pause efficiently
-                        if self.paused and self.running and not self.showing_progress:
-                            self.pause_event.wait()
-                        
-                        if not self.running or self.showing_progress:
-                            sequence_completed = False
-                            break
+                        # Handle pause efficiently; state only needs re-checking after a pause
+                        if not pause_event.is_set():
+                            pause_event.wait()
+                            if not self.running or self.showing_progress:
+                                sequence_completed = False
+                                break
+                            deadline = monotonic()  # Don't try to catch up on time spent paused
+                            last_frame = None  # The screen may have changed while paused
                         
                         # Get and display frame
-                        frame_data = sequence.get_next_frame(timeout=2.0)
-                        frame_duration = sequence.get_frame_duration(frame_idx)
+                        frame_data = get_next_frame(timeout=2.0)
                         
                         if not frame_data:
                             sequence_completed = False
                             break
                         
                         # Display frame with hardware availability check
-                        display_start = time.time()
                         if self.display_available:
                             try:
-                                self.logger.debug(f"🖼️ Displaying frame {frame_idx+1}/{frame_count} ({len(frame_data)} bytes)")
-                                self.display_driver.display_frame(frame_data)
+                                if message_display.draw_generation != message_draws:
+                                    message_draws = message_display.draw_generation
+                                    last_frame = None
+                                if frame_data is last_frame or frame_data == last_frame:
+                                    self.logger.debug(f"🖼️ Frame {frame_idx+1}/{frame_count} unchanged, skipping transfer")
+                                else:
+                                    self.logger.debug(f"🖼️ Displaying frame {frame_idx+1}/{frame_count} ({len(frame_data)} bytes)")
+                                    display_frame(frame_data)
+                                    # The message worker only needs telling when playback takes the
+                                    # screen back: first frame of a pass, after a pause, or after it drew
+                                    if last_frame is None:
+                                        invalidate_screen()
+                                    last_frame = frame_data
                             except Exception as e:
                                 # Display failed - mark hardware as unavailable
                                 self.display_available = False
@@ -884,14 +1022,20 @@ class DisplayPlayer:
                             self.logger.debug(f"🔄 Demo mode: simulating frame {frame_idx+1}/{frame_count} display")
                             time.sleep(0.001)  # Minimal delay to simulate display processing
                         
-                        display_time = time.time() - display_start
+                        if frame_idx == prefetch_at:
+                            self._prefetch_next_sequence()
                         
-                        # Frame timing
-                        target_frame_time = frame_duration if frame_duration > 0 else (1.0 / self.frame_rate)
-                        sleep_time = max(0, target_frame_time - display_time)
+                        # Frame timing - sleep until this frame's deadline
+                        target_frame_time = frame_times[frame_idx]
+                        deadline += target_frame_time
+                        now = monotonic()
+                        sleep_time = deadline - now
                         
                         if sleep_time > 0:
-                            time.sleep(sleep_time)
+                            sleep(sleep_time)
+                        elif sleep_time < -target_frame_time:
+                            # More than a frame behind (slow SD read, stall) - resync instead of rushing
+                            deadline = now
                     
                     if not sequence_completed:
                         continue
@@ -899,40 +1043,18 @@ class DisplayPlayer:
                 # Handle loop logic after completing sequence
                 self.current_media_loops += 1
                 
-                should_continue_current_media = True
-                
-                if self.loop_mode == "one":
-                    # Loop one mode - keep looping current media
-                    if self.loop_count > 0 and self.current_media_loops >= self.loop_count:
-                        self.current_media_loops = 0
-                else:
-                    # Loop all mode - decide whether to switch media
-                    current_loop_slugs = media_index.list_loop()
-                    
-                    if len(current_loop_slugs) <= 1:
-                        # Only one media - keep looping
-                        if self.loop_count > 0 and self.current_media_loops >= self.loop_count:
-                            self.current_media_loops = 0
-                    else:
-                        # Multiple media - check if should switch
-                        if not self.media_config.auto_advance_enabled:
-                            should_continue_current_media = True
-                        elif self.loop_count <= 0:
-                            # Infinite loops - play once then move to next
-                            should_continue_current_media = False
-                        elif self.current_media_loops >= self.loop_count:
-                            # Completed required loops - move to next
-                            should_continue_current_media = False
-                
-                if not should_continue_current_media:
+                if self._should_advance(self.current_media_loops, media_index.loop_length()):
                     # Switch to next media
+                    # next_media() already detaches and stops the finished sequence
                     self.next_media()
-                    self.current_sequence = None
+                    self.current_media_loops = 0
+                elif self.loop_count > 0 and self.current_media_loops >= self.loop_count:
+                    # Keep looping current media
                     self.current_media_loops = 0
                 
             except Exception as e:
                 self.logger.error(f"Error in playback loop: {e}")
-                time.sleep(1)
+                self._stop_event.wait(1)
         
         self.logger.info("Playback loop ended")
     
@@ -940,6 +1062,7 @@ class DisplayPlayer:
         """Start the display player."""
         if not self.running:
             self.running = True
+            self._stop_event.clear()
             self.wifi_status_manager.start()
             self.playback_thread = threading.Thread(target=self.run, daemon=True)
             self.playback_thread.start()
@@ -949,6 +1072,11 @@ class DisplayPlayer:
         """Stop the display player."""
         if self.running:
             self.running = False
+            self._stop_event.set()
+            self._media_changed.set()
+            self._cancel_pending_refresh()
+            # Release a paused playback thread so it can observe running=False
+            self.pause_event.set()
             self.stop_processing_display()
             
             # Stop WiFi status manager
@@ -961,6 +1089,8 @@ class DisplayPlayer:
 
             if self.playback_thread:
                 self.playback_thread.join(timeout=5)
+            # After the join, so a prefetch started by the playback thread's last pass is stopped too
+            self._take_prefetched(None)
             self.logger.info("Display player stopped")
 
             # Stop the message display worker thread gracefully
@@ -972,14 +1102,13 @@ class DisplayPlayer:
     def get_status(self) -> Dict:
         """Get current playback status."""
         current_media = media_index.get_active()
-        loop_slugs = media_index.list_loop()
         current_index = self.get_current_media_index()
         
         return {
             "is_playing": self.running and not self.paused,
             "current_media": current_media,
             "loop_index": current_index,
-            "total_media": len(loop_slugs),
+            "total_media": media_index.loop_length(),
             "frame_rate": self.frame_rate,
             "loop_mode": self.loop_mode,
             "showing_progress": self.showing_progress
@@ -1004,28 +1133,61 @@ class DisplayPlayer:
         pass
     
     def refresh_media_list(self) -> None:
+        """Refresh the media list, coalescing calls that arrive in quick succession."""
+        # Wake the idle loop now; the sequence restart waits for the burst to settle
+        with self._refresh_lock:
+            self._refresh_requests += 1
+            if self._refresh_timer:
+                self._refresh_timer.cancel()
+            self._media_changed.set()
+            self._refresh_timer = threading.Timer(self._refresh_delay, self._do_refresh_media_list)
+            self._refresh_timer.daemon = True
+            self._refresh_timer.start()
+    
+    def _cancel_pending_refresh(self) -> None:
+        """Cancel a scheduled media list refresh, if any."""
+        with self._refresh_lock:
+            if self._refresh_timer:
+                self._refresh_timer.cancel()
+                self._refresh_timer = None
+    
+    def _do_refresh_media_list(self) -> None:
         """Refresh the media list by clearing current sequence to force reload."""
+        with self._refresh_lock:
+            self._refresh_timer = None
+            requests = self._refresh_requests
+        
+        self._take_prefetched(None)  # Loop order may have changed
         with self.lock:
-            if self.current_sequence:
-                self.current_sequence.stop()
-            self.current_sequence = None
+            if self._sequence_refresh == requests:
+                # Loaded after the last request (e.g. the idle loop picked up a new upload
+                # right away) - restarting it would only jump back to frame 0
+                sequence = None
+            else:
+                sequence, self.current_sequence = self.current_sequence, None
             
-            # If no media exists, clear active media
-            loop_slugs = media_index.list_loop()
-            if not loop_slugs:
-                media_index.set_active(None)
+            # If no media exists, reset loop tracking
+            loop_empty = not media_index.loop_length()
+            if loop_empty:
                 self.current_media_loops = 0
+        
+        # Slow work (joining the producer thread, index write) happens outside the lock
+        if sequence:
+            sequence.stop()
+        if loop_empty:
+            # If no media exists, clear active media
+            media_index.set_active(None)
     
     def handle_media_deletion(self, deleted_slug: str) -> None:
         """Handle immediate media deletion to prevent frame loading errors."""
+        self._media_changed.set()
+        self._take_prefetched(None)
         with self.lock:
             # Check if the deleted media is currently playing
             current_active = media_index.get_active()
             
-            # Stop current sequence immediately if it matches deleted media
-            if self.current_sequence:
-                self.current_sequence.stop()
-                self.current_sequence = None
+            # Detach current sequence immediately; it is stopped once the lock is released
+            sequence, self.current_sequence = self.current_sequence, None
             
             # Clear logged missing frames for deleted media to avoid spam
             if deleted_slug in self._logged_missing_frames:
@@ -1043,6 +1205,13 @@ class DisplayPlayer:
                     self.logger.info(f"No valid media remaining after deleting {deleted_slug}")
             
             self.logger.info(f"Handled deletion of media: {deleted_slug}")
+        
+        if sequence:
+            sequence.stop()
+        
+        # Drop the deleted media's frames only once its producer can no longer re-cache them
+        if self.frame_cache:
+            self.frame_cache.discard(deleted_slug)
     
     def _find_and_load_next_valid_media(self) -> bool:
         """Find and load the next valid media with wraparound search."""
@@ -1068,13 +1237,8 @@ class DisplayPlayer:
             
             if frames_dir.exists():
                 try:
-                    # Get frame info from media metadata
-                    frame_count = media_info.get('frame_count', 0)
-                    fps = media_info.get('fps', 25)  # Default 25fps
-                    frame_duration = 1.0 / fps
-                    
                     # Create frame sequence
-                    self.current_sequence = FrameSequence(frames_dir, frame_count, frame_duration)
+                    self.current_sequence = self._create_sequence(media_info, frames_dir)
                     
                     if self.current_sequence.get_frame_count() == 0:
                         self.logger.error(f"No frames found in {frames_dir}")
@@ -1108,16 +1272,13 @@ class DisplayPlayer:
     # ------------------------------------------------------------
     def pause(self) -> None:
         """Pause playback (idempotent)."""
-        with self.lock:
-            if not self.paused:
-                self.paused = True
-                self.pause_event.clear()
-                self.logger.info("Playback paused (external)")
+        # Event.clear()/set() are thread-safe and idempotent, so no player lock is needed
+        if self.pause_event.is_set():
+            self.pause_event.clear()
+            self.logger.info("Playback paused (external)")
 
     def resume(self) -> None:
         """Resume playback if currently paused."""
-        with self.lock:
-            if self.paused:
-                self.paused = False
-                self.pause_event.set()
-                self.logger.info("Playback resumed (external)") 
\ No newline at end of file
+        if not self.pause_event.is_set():
+            self.pause_event.set()
+            self.logger.info("Playback resumed (external)") 
\ No newline at end of file
@@ -110,11 +110,17 @@ class ILI9341Driver:
             # Switch to data mode
             self.disp.digital_write(self.disp.DC_PIN, True)
 
-            # Send the buffer in 4 kB chunks using memory pool
-            chunk_size = 4096  # 4 kB chunks stay within default spidev bufsiz limit
-            for offset in range(0, len(frame_data), chunk_size):
-                # Direct slice is bytes – new spi_writebyte handles bytes efficiently.
-                self.disp.spi_writebyte(frame_data[offset:offset + chunk_size])
+            # Send the whole frame in one call: writebytes2 (spidev >= 3.5) splits it at the
+            # kernel's bufsiz in C, so Python does no per-chunk slicing or call overhead
+            writefast = getattr(self.disp.SPI, "writebytes2", None)
+            if writefast:
+                writefast(frame_data)
+            else:
+                # Older spidev - 4 kB chunks stay within default spidev bufsiz limit
+                chunk_size = 4096
+                view = memoryview(frame_data)
+                for offset in range(0, len(frame_data), chunk_size):
+                    self.disp.spi_writebyte(view[offset:offset + chunk_size])
                 
         except Exception as e:
             self.logger.error(f"Frame display failed: {e}")
@@ -136,12 +142,12 @@ class ILI9341Driver:
             
             color_bytes = struct.pack('>H', color)
             
-            # Fill buffer with color
-            for i in range(0, len(frame_data), 2):
-                frame_data[i:i+2] = color_bytes
+            # Fill buffer with color in one big-endian slice assignment
+            frame_data[:] = color_bytes * (len(frame_data) // 2)
             
-            # Use existing RGB565 display path - pass copy since buffer will be returned
-            self.display_frame(bytes(frame_data))
+            # Use existing RGB565 display path - display_frame is synchronous, so the
+            # pooled buffer can be sent as-is before it goes back to the pool
+            self.display_frame(frame_data)
 
     def set_backlight(self, level: Union[int, bool]) -> None:
         """Set backlight brightness - hardware PWM only.
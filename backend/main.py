@@ -460,6 +460,12 @@ class LOOPApplication:
                     self.logger.warning(f"Failed to show boot message: {e}")
                     pass
             
+            # Move long-lived startup objects (modules, app, routes) to the permanent
+            # generation so periodic collections don't rescan them while frames play
+            gc.collect()
+            gc.freeze()
+            self.logger.debug(f"Froze {gc.get_freeze_count()} startup objects out of GC")
+            
             # Main loop
             self._main_loop()
             
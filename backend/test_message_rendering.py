@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Test script for the message text renderer.
+Compares the glyph-region renderer against a full-frame PIL render, including
+titles whose glyphs extend left of or above the text origin (e.g. "j", "_x").
+Needs no display hardware.
+"""
+
+import struct
+import sys
+from pathlib import Path
+
+# Add backend to Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from PIL import Image, ImageDraw
+
+from config.schema import DisplayConfig
+from display.messages import MessageDisplay, _rgb888_to_rgb565
+
+TITLES = ["j", "jpg", "_x", "ƒoo", "Loop", "Uploading Media"]
+SUBTITLE = "jpeg queued"
+
+
+class _NullDriver:
+    """Display driver stand-in; the renderer under test never reaches the hardware."""
+
+    def display_frame(self, frame_data: bytes) -> None:
+        pass
+
+    def fill_screen(self, color: int = 0) -> None:
+        pass
+
+
+def _render_full_frame(display: MessageDisplay, title: str, subtitle: str,
+                       bg_color, text_color, title_size: int, subtitle_size: int) -> bytes:
+    """Reference: draw onto a full-screen PIL image and convert every pixel to RGB565."""
+    width, height = display.config.width, display.config.height
+    image = Image.new('RGB', (width, height), bg_color)
+    draw = ImageDraw.Draw(image)
+    title_font = display._get_font(title_size, bold=True)
+    subtitle_font = display._get_font(subtitle_size, bold=False)
+
+    y_offset = 60
+    if title and title_font:
+        bbox = draw.textbbox((0, 0), title, font=title_font)
+        title_x = (width - (bbox[2] - bbox[0])) // 2
+        draw.text((title_x, y_offset), title, fill=text_color, font=title_font)
+        y_offset += bbox[3] - bbox[1] + 20
+    if subtitle and subtitle_font:
+        bbox = draw.textbbox((0, 0), subtitle, font=subtitle_font)
+        subtitle_x = (width - (bbox[2] - bbox[0])) // 2
+        draw.text((subtitle_x, y_offset), subtitle, fill=text_color, font=subtitle_font)
+
+    rgb = image.tobytes()
+    return b''.join(struct.pack('>H', _rgb888_to_rgb565(*rgb[i:i + 3])) for i in range(0, len(rgb), 3))
+
+
+def test_text_matches_full_frame_render():
+    """Glyph-region text must be pixel-identical to the full-frame render."""
+    display = MessageDisplay(_NullDriver(), DisplayConfig())
+    try:
+        for title in TITLES:
+            for bg_color, text_color in [((0, 0, 0), (255, 255, 255)), ((20, 40, 80), (255, 200, 0))]:
+                actual = display._render_text_image_rgb565(title, SUBTITLE, bg_color, text_color, 24, 16)
+                expected = _render_full_frame(display, title, SUBTITLE, bg_color, text_color, 24, 16)
+                assert actual == expected, f"{title!r} on {bg_color} differs from the full-frame render"
+    finally:
+        display.stop()
+
+
+if __name__ == "__main__":
+    print("🎨 LOOP Message Rendering Test")
+    print("=" * 40)
+
+    try:
+        test_text_matches_full_frame_render()
+    except AssertionError as e:
+        print(f"\n💥 {e}")
+        sys.exit(1)
+
+    print("\n🎉 Message rendering matches the full-frame renderer!")
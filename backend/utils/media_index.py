@@ -114,6 +114,9 @@ class MediaIndexManager:
         self._cache: Optional[MediaIndex] = None
         self._cache_dirty = False
         self._last_file_read = 0
+        self._file_mtime_ns: Optional[int] = None  # mtime of the file the cache reflects
+        # slug -> loop position, tagged with the loop list (and its length) it was built from
+        self._loop_positions: Optional[tuple] = None
         self._cache_lock = threading.Lock()
         
         # Batching support
@@ -163,31 +166,38 @@ class MediaIndexManager:
                 
                 # Only check file modification if cache is older
                 try:
-                    file_mtime = self.index_path.stat().st_mtime
-                    if file_mtime <= self._last_file_read:
+                    if self.index_path.stat().st_mtime_ns == self._file_mtime_ns:
                         # Update cache timestamp to extend aggressive cache period
                         self._last_file_read = time.time()
                         return self._cache
                 except (OSError, FileNotFoundError):
                     pass
             
-            # Read from disk
+            # Read from disk - stat first so a write racing the read triggers another re-read
+            self._file_mtime_ns = self._stat_mtime_ns()
             index = self._read_from_disk()
             self._cache = index
             self._cache_dirty = False
             self._last_file_read = time.time()
             return index
     
+    def _stat_mtime_ns(self) -> Optional[int]:
+        """Modification time of the index file in nanoseconds, or None if missing."""
+        try:
+            return self.index_path.stat().st_mtime_ns
+        except (OSError, FileNotFoundError):
+            return None
+    
     def _read_from_disk(self) -> MediaIndex:
         """Read the media index from disk."""
         if not self.index_path.exists():
             return MediaIndex.empty()
         
         try:
-            with open(self.index_path, "r") as f:
+            with open(self.index_path, "rb") as f:
                 fcntl.flock(f.fileno(), fcntl.LOCK_EX)
                 try:
-                    data = json.load(f)
+                    data = json.loads(f.read())
                 finally:
                     fcntl.flock(f.fileno(), fcntl.LOCK_UN)
 
@@ -274,6 +284,7 @@ class MediaIndexManager:
         with self._cache_lock:
             self._cache = index
             self._cache_dirty = True
+            self._loop_positions = None
             
             # Always write critical operations immediately
             # Simplified logic: if _force_immediate_write was called, write now
@@ -318,25 +329,30 @@ class MediaIndexManager:
             self.index_path.parent.mkdir(parents=True, exist_ok=True)
             LOGGER.info(f"💾 Parent directory ensured: {self.index_path.parent}")
 
+            # Encode up front so the file lock only covers the raw write
+            data_to_write = index.to_dict()
+            LOGGER.info(f"💾 Data to write: media={len(data_to_write['media'])}, loop={len(data_to_write['loop'])}")
+            payload = json.dumps(data_to_write, indent=2).encode("utf-8")
+
             # Write to temporary file first for atomic operation
             temp_file = self.index_path.with_suffix('.json.tmp')
             LOGGER.info(f"💾 Writing to temp file: {temp_file}")
             
-            with open(temp_file, "w") as f:
+            with open(temp_file, "wb") as f:
                 fcntl.flock(f.fileno(), fcntl.LOCK_EX)
                 try:
-                    data_to_write = index.to_dict()
-                    LOGGER.info(f"💾 Data to write: media={len(data_to_write['media'])}, loop={len(data_to_write['loop'])}")
-                    json.dump(data_to_write, f, indent=2)
+                    f.write(payload)
                     f.flush()
                     os.fsync(f.fileno())  # Ensure data is written to disk
                     LOGGER.info(f"💾 Data written and flushed to temp file")
                 finally:
                     fcntl.flock(f.fileno(), fcntl.LOCK_UN)
 
-            # Atomic rename
+            # Atomic rename (same directory, so os.replace never falls back to a copy)
             LOGGER.info(f"💾 Moving {temp_file} -> {self.index_path}")
-            shutil.move(str(temp_file), str(self.index_path))
+            os.replace(temp_file, self.index_path)
+            # Our own write is already reflected in the cache - don't re-parse it
+            self._file_mtime_ns = self._stat_mtime_ns()
             
             # Verify the file was written
             if self.index_path.exists():
@@ -384,10 +400,47 @@ class MediaIndexManager:
         """Return the media dictionary directly."""
         return self._read_raw().media.copy()
 
+    def get_media(self, slug: str) -> Optional[Dict[str, Any]]:
+        """Return the metadata for a single slug without copying the media dictionary."""
+        return self._read_raw().media.get(slug)
+
     def list_loop(self) -> List[str]:
         """Return the current loop slug list."""
         return self._read_raw().loop.copy()
 
+    def loop_length(self) -> int:
+        """Return the number of items in the loop without copying the slug list."""
+        return len(self._read_raw().loop)
+
+    def _positions_for(self, loop: List[str]) -> Dict[str, int]:
+        """slug -> position map for loop, rebuilt only when the loop changes."""
+        # Built and stored under the cache lock so _write_raw's reset can't interleave and
+        # leave a map built from a since-edited loop that still matches identity and length
+        with self._cache_lock:
+            n = len(loop)
+            cached = self._loop_positions
+            if cached is not None and cached[0] is loop and cached[1] == n:
+                return cached[2]
+            positions = {slug: i for i, slug in enumerate(loop)}
+            self._loop_positions = (loop, n, positions)
+            return positions
+
+    def loop_position(self, slug: Optional[str]) -> Optional[int]:
+        """Return the position of slug in the loop, or None if it is not in the loop."""
+        if not slug:
+            return None
+        index = self._read_raw()
+        return self._positions_for(index.loop).get(slug)
+
+    def get_loop_neighbor(self, offset: int) -> Optional[str]:
+        """Return the slug offset steps from the active one (wrapping), or None if the loop has fewer than two items."""
+        index = self._read_raw()
+        loop = index.loop
+        if len(loop) <= 1:
+            return None
+        current = self._positions_for(loop).get(index.active, 0) if index.active else 0
+        return loop[(current + offset) % len(loop)]
+
     def get_active(self) -> Optional[str]:
         """Return the currently active media slug."""
         index = self._read_raw()
@@ -236,7 +236,7 @@ class UploadCoordinator:
             transaction.merged_slug = final_slug
             
             if final_slug:
-                final_metadata = media_index.get_media_dict().get(final_slug)
+                final_metadata = media_index.get_media(final_slug)
                 if final_metadata:
                     await broadcaster.media_uploaded(final_metadata)
                     await broadcaster.loop_updated(media_index.list_loop())
@@ -393,7 +393,7 @@ class UploadCoordinator:
         # Create or update metadata
         if original_slug:
             # Merge with existing metadata
-            existing_meta = media_index.get_media_dict().get(original_slug, {})
+            existing_meta = media_index.get_media(original_slug) or {}
             metadata = {
                 **existing_meta,
                 "processing_status": "completed",